@@ -1,10 +1,11 @@
 #!/usr/bin/env python3
 
-import importlib.util
+from importlib import import_module
 import inspect
 import os
 
 from clove.network.bitcoin.base import BitcoinBaseNetwork
+from clove.network.ethereum.base import EthereumBaseNetwork
 
 IGNORED = (
     '__init__.py',
@@ -13,54 +14,98 @@ IGNORED = (
 )
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
 
+HEADER = """from importlib import import_module
+import sys
+from typing import Iterator"""
 
-def get_networks(dir_name, base_class):
-    base_class_name = base_class.__name__
+FOOTER = """
+
+def __getattr__(name: str):
+    '''
+    Imports network classes on first access (PEP 562).
+
+    Only the module of the requested network is imported, eg. `from clove.network import Bitcoin`
+    does not load Ethereum-based networks. Accessing `BITCOIN_BASED`, `ETHEREUM_BASED` or `__all__`
+    imports all networks from the given group.
+    '''
+    if name == 'BITCOIN_BASED':
+        value = tuple(__getattr__(network) for network in _BITCOIN_BASED)
+    elif name == 'ETHEREUM_BASED':
+        value = tuple(__getattr__(network) for network in _ETHEREUM_BASED)
+    elif name == '__all__':
+        value = __getattr__('BITCOIN_BASED') + __getattr__('ETHEREUM_BASED')
+    elif name in _NETWORK_MODULES:
+        value = getattr(import_module(_NETWORK_MODULES[name]), name)
+    else:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+    globals()[name] = value
+    return value
+
+
+def iter_seed_metadata() -> Iterator[tuple]:
+    '''
+    Yields (network name, seed node address) pairs for all Bitcoin-based networks.
+
+    Example:
+        >>> from clove.network import iter_seed_metadata
+        >>> next(iter_seed_metadata())
+        ('bitcoin', 'seed.bitcoin.sipa.be')
+    '''
+    for network in __getattr__('BITCOIN_BASED'):
+        for seed in network.seeds:
+            yield network.name, seed
+
+
+if sys.version_info < (3, 7):
+    # module level __getattr__ is not supported, so all networks have to be imported eagerly
+    __getattr__('__all__')"""
+
+
+def get_module_networks(module_name, base_class):
+    module = import_module(module_name)
+    return [
+        item for _, item in inspect.getmembers(module, inspect.isclass)
+        if issubclass(item, base_class) and item.__module__ == module_name
+    ]
+
+
+def get_networks(base_module_name, dir_name, base_class):
     network_dir = os.path.join(BASE_DIR, f'clove/network/{dir_name}/')
     networks = sorted([file for file in os.listdir(network_dir) if file not in IGNORED])
-    network_classes = []
-    imports = []
-
-    for filename in networks:
-        spec = importlib.util.spec_from_file_location(
-            'module.name',
-            f'{network_dir}/{filename}'
-        )
-        module = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(module)
-        classes = []
-        members = dir(module)
-        assert base_class_name in members, f'Not importing {base_class_name}'
-        for member in members:
-            if member.startswith('__') or member == base_class_name:
-                continue
-            item = getattr(module, member)
-            if inspect.isclass(item) and issubclass(item, base_class):
-                classes.append(item)
-        class_names = ', '.join([c.__name__ for c in classes])
-        network_classes.append(class_names)
-        imports.append(f'from clove.network.{dir_name}.{filename[:-3]} import {class_names}')
-    return network_classes, imports
-
-
-bitcoin_classes, bitcoin_imports = get_networks('bitcoin_based', BitcoinBaseNetwork)
-
-
-print('from clove.network.bitcoin import Bitcoin, BitcoinTestNet')
-
-for import_str in bitcoin_imports:
-    print(import_str)
-
-print('from clove.network.ethereum import Ethereum, EthereumTestnet')
-
-print('\nBITCOIN_BASED = (')
-print('    Bitcoin, BitcoinTestNet,')
-for classes in bitcoin_classes:
-    print(f'    {classes},')
-print(')\n')
-
-print('ETHEREUM_BASED = (')
-print('    Ethereum, EthereumTestnet,')
-print(')\n')
-
-print('\n__all__ = BITCOIN_BASED + ETHEREUM_BASED')
+    module_names = [base_module_name] + [f'clove.network.{dir_name}.{filename[:-3]}' for filename in networks]
+    # base classes are imported first, so they are listed before their test networks
+    return [
+        network for module_name in module_names
+        for network in sorted(get_module_networks(module_name, base_class), key=lambda n: n.testnet)
+    ]
+
+
+def print_network_modules(name, description, networks):
+    print(f'\n{name} = {{')
+    for network in networks:
+        print(f"    '{network.__name__}': '{network.__module__}',")
+    print('}')
+    print(f"'''{description}'''")
+
+
+bitcoin_networks = get_networks('clove.network.bitcoin', 'bitcoin_based', BitcoinBaseNetwork)
+ethereum_networks = get_networks('clove.network.ethereum', 'ethereum_based', EthereumBaseNetwork)
+
+print(HEADER)
+print_network_modules('_BITCOIN_BASED', 'Bitcoin-based network class names and modules in which they are defined.',
+                      bitcoin_networks)
+print_network_modules('_ETHEREUM_BASED', 'Ethereum-based network class names and modules in which they are defined.',
+                      ethereum_networks)
+
+print('\n_NETWORK_MODULES = {**_BITCOIN_BASED, **_ETHEREUM_BASED}')
+print("'''Mapping of network class names to modules in which they are defined.'''")
+
+print('\n_NETWORK_SYMBOLS = {')
+for network in bitcoin_networks + ethereum_networks:
+    suffix = '-TESTNET' if network.testnet else ''
+    for symbol in network.symbols:
+        print(f"    '{symbol.upper()}{suffix}': '{network.__name__}',")
+print('}')
+print("'''Mapping of network symbols (with `-TESTNET` suffix for test networks) to network class names.'''")
+
+print(FOOTER)
@@ -1,13 +1,16 @@
+from operator import itemgetter
 from typing import Optional
 
 from bitcoin.core import CTxOut
 
 from clove.block_explorer.base import BaseAPI
-from clove.network.bitcoin.utxo import Utxo
+from clove.network.bitcoin.utxo import get_utxo_from_base_units
 from clove.utils.bitcoin import from_base_units
 from clove.utils.external_source import clove_req_json
 from clove.utils.logging import logger
 
+_utxo_fields = itemgetter('tx_hash', 'tx_output_n', 'value', 'script')
+
 
 class BlockcypherAPI(BaseAPI):
     '''Adapter class for blockcypher.com'''
@@ -40,7 +43,7 @@ class BlockcypherAPI(BaseAPI):
             >>> network.get_latest_block()
             544989
         '''
-        return clove_req_json(f'{cls.blockcypher_url()}')['height']
+        return clove_req_json(cls.blockcypher_url())['height']
 
     @classmethod
     def get_transaction(cls, tx_address: str) -> Optional[dict]:
@@ -125,22 +128,15 @@ class BlockcypherAPI(BaseAPI):
         for output in unspent:
             output['value'] = int(output['value'])
 
-        unspent = sorted(unspent, key=lambda k: k['value'], reverse=True)
+        unspent = sorted(unspent, key=itemgetter('value'), reverse=True)
 
         utxo = []
         total = 0
 
         for output in unspent:
-            value = from_base_units(output['value'])
-            utxo.append(
-                Utxo(
-                    tx_id=output['tx_hash'],
-                    vout=output['tx_output_n'],
-                    value=value,
-                    tx_script=output['script'],
-                )
-            )
-            total += value
+            output_utxo = get_utxo_from_base_units(cls.name, *_utxo_fields(output))
+            utxo.append(output_utxo)
+            total += output_utxo.value
             if total > amount:
                 return utxo
 
@@ -199,22 +195,19 @@ class BlockcypherAPI(BaseAPI):
         return from_base_units(data['balance'] or data['unconfirmed_balance'])
 
     @classmethod
-    def get_transaction_url(cls, tx_hash: str) -> str:
+    def get_transaction_url_template(cls) -> str:
         """
-        Returns transaction url for a given transaction hash in block explorer.
-
-        Args:
-            tx_hash (str): transaction hash
+        Returns format string for transaction url in block explorer.
 
         Returns:
-            str: Url to transaction
+            str: Url to transaction with `{}` placeholder for transaction hash
         """
         if cls.testnet:
             network_name = f'{cls.symbols[0].lower()}-testnet'
         else:
             network_name = cls.symbols[0].lower()
         url = cls.api_url.replace('api.', 'live.')
-        return f'{url}/{network_name}/tx/{tx_hash}/'
+        return f'{url}/{network_name}/tx/{{}}/'
 
     @classmethod
     def get_fee(cls) -> Optional[float]:
@@ -1,14 +1,18 @@
+from operator import itemgetter
 import os
 from typing import Optional
 
 from bitcoin.core import CTxOut, script
 
 from clove.block_explorer.base import BaseAPI
-from clove.network.bitcoin.utxo import Utxo
-from clove.utils.bitcoin import from_base_units, to_base_units
+from clove.network.bitcoin.utxo import get_utxo_from_base_units
+from clove.utils.bitcoin import to_base_units
 from clove.utils.external_source import clove_req_json
 from clove.utils.logging import logger
 
+# `tx_ouput_n` is spelled as in cryptoid API responses
+_utxo_fields = itemgetter('tx_hash', 'tx_ouput_n', 'value', 'script')
+
 
 class CryptoidAPI(BaseAPI):
 
@@ -124,22 +128,15 @@ class CryptoidAPI(BaseAPI):
         for output in unspent:
             output['value'] = int(output['value'])
 
-        unspent = sorted(unspent, key=lambda k: k['value'], reverse=True)
+        unspent = sorted(unspent, key=itemgetter('value'), reverse=True)
 
         utxo = []
         total = 0
 
         for output in unspent:
-            value = from_base_units(output['value'])
-            utxo.append(
-                Utxo(
-                    tx_id=output['tx_hash'],
-                    vout=output['tx_ouput_n'],
-                    value=value,
-                    tx_script=output['script'],
-                )
-            )
-            total += value
+            output_utxo = get_utxo_from_base_units(cls.name, *_utxo_fields(output))
+            utxo.append(output_utxo)
+            total += output_utxo.value
             if total > amount:
                 return utxo
 
@@ -212,17 +209,14 @@ class CryptoidAPI(BaseAPI):
         return data
 
     @classmethod
-    def get_transaction_url(cls, tx_hash: str) -> Optional[str]:
+    def get_transaction_url_template(cls) -> str:
         """
-        Returns transaction url for a given transaction hash in block explorer.
-
-        Args:
-            tx_hash (str): transaction hash
+        Returns format string for transaction url in block explorer.
 
         Returns:
-            str: Url to transaction
+            str: Url to transaction with `{}` placeholder for transaction hash
         """
-        return f'{cls.api_url}/{cls.symbols[0].lower()}/tx.dws?{tx_hash}.htm'
+        return f'{cls.api_url}/{cls.symbols[0].lower()}/tx.dws?{{}}.htm'
 
     @classmethod
     def _get_last_transactions(cls) -> Optional[list]:
@@ -1,4 +1,5 @@
 from json import JSONDecodeError
+from operator import itemgetter
 import time
 from typing import Optional
 
@@ -6,11 +7,13 @@ from bitcoin.core import CTxOut, script
 import requests
 
 from clove.block_explorer.base import BaseAPI
-from clove.network.bitcoin.utxo import Utxo
+from clove.network.bitcoin.utxo import get_utxo_from_base_units
 from clove.utils.bitcoin import from_base_units, to_base_units
 from clove.utils.external_source import clove_req_json
 from clove.utils.logging import logger
 
+_utxo_fields = itemgetter('txid', 'vout', 'satoshis', 'scriptPubKey')
+
 
 class InsightAPIv4(BaseAPI):
     '''
@@ -124,22 +127,15 @@ class InsightAPIv4(BaseAPI):
         if not data:
             logger.debug(f'Cannot find UTXO for address {address} ({cls.symbols[0]})')
             return
-        unspent = sorted(data, key=lambda k: k['satoshis'], reverse=True)
+        unspent = sorted(data, key=itemgetter('satoshis'), reverse=True)
 
         utxo = []
         total = 0
 
         for output in unspent:
-            value = from_base_units(output['satoshis'])
-            utxo.append(
-                Utxo(
-                    tx_id=output['txid'],
-                    vout=output['vout'],
-                    value=value,
-                    tx_script=output['scriptPubKey'],
-                )
-            )
-            total += value
+            output_utxo = get_utxo_from_base_units(cls.name, *_utxo_fields(output))
+            utxo.append(output_utxo)
+            total += output_utxo.value
             if total > amount:
                 return utxo
 
@@ -198,23 +194,19 @@ class InsightAPIv4(BaseAPI):
         return from_base_units(wallet_utxo)
 
     @classmethod
-    def get_transaction_url(cls, tx_hash: str) -> Optional[str]:
+    def get_transaction_url_template(cls) -> str:
         '''
-        Returns URL for a given transaction in block explorer.
-
-        Args:
-            tx_hash (str): transaction hash
+        Returns format string for transaction URL in block explorer.
 
         Returns:
-            str, None: URL for transaction in block explorer or `None` if there is no block explorer
+            str: URL for transaction in block explorer with `{}` placeholder for transaction hash
 
         Example:
             >>> from clove.network import Ravencoin
-            >>> r = Ravencoin()
-            >>> r.get_transaction_url('8a673e9fcf5ea469e7c4180846834905e8d4c0f16c6e6ab9531efbb9112bc5e1')
-            'https://ravencoin.network/tx/8a673e9fcf5ea469e7c4180846834905e8d4c0f16c6e6ab9531efbb9112bc5e1'
+            >>> Ravencoin.get_transaction_url_template()
+            'https://ravencoin.network/tx/{}'
         '''
-        return f'{cls.ui_url}/tx/{tx_hash}'
+        return f'{cls.ui_url}/tx/{{}}'
 
     @classmethod
     def _get_block_hash(cls, block_number: int) -> str:
@@ -5,6 +5,7 @@ COLORED_LOGS_STYLES = {
     'warning': {'color': 'yellow'}
 }
 NODE_COMMUNICATION_TIMEOUT = 2 * 60
+SEED_RESOLVING_TIMEOUT = 5
 TRANSACTION_BROADCASTING_MAX_ATTEMPTS = 10
 
 SIGNATURE_SIZE = 110
@@ -15,6 +16,10 @@ REJECT_TIMEOUT = 10
 
 CLOVE_API_URL = 'https://clove-api.lamden.io'
 
+# How many seconds fee fetched from Clove API is considered fresh / can be still used
+FEE_CACHE_FRESH_TTL = 60
+FEE_CACHE_STALE_TTL = 60 * 60
+
 ETH_REDEEM_GAS_LIMIT = 100000
 ETH_REFUND_GAS_LIMIT = 100000
 
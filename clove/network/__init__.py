@@ -1,131 +1,247 @@
-from clove.network.bitcoin import Bitcoin, BitcoinTestNet
-from clove.network.bitcoin_based.aquariuscoin import AquariusCoin
-from clove.network.bitcoin_based.audiocoin import AudioCoin, AudioCoinTestNet
-from clove.network.bitcoin_based.bata import Bata, BataTestNet
-from clove.network.bitcoin_based.bitcoin_cash import BitcoinCash, BitcoinCashTestNet
-from clove.network.bitcoin_based.bitcoin_gold import BitcoinGold, BitcoinGoldTestNet
-from clove.network.bitcoin_based.bitcore import Bitcore, BitcoreTestNet
-from clove.network.bitcoin_based.bitmark import Bitmark
-from clove.network.bitcoin_based.bitsend import BitSend, BitSendTestNet
-from clove.network.bitcoin_based.blackcoin import BlackCoin
-from clove.network.bitcoin_based.blocknet import Blocknet
-from clove.network.bitcoin_based.creativecoin import CreativeCoin, CreativeCoinTestNet
-from clove.network.bitcoin_based.dash import Dash, DashTestNet
-from clove.network.bitcoin_based.digibyte import Digibyte
-from clove.network.bitcoin_based.dopecoin import Dopecoin
-from clove.network.bitcoin_based.egulden import EGulden, EGuldenTestNet
-from clove.network.bitcoin_based.eternity import Eternity, EternityTestNet
-from clove.network.bitcoin_based.europecoin import Europecoin
-from clove.network.bitcoin_based.goldcoin import Goldcoin
-from clove.network.bitcoin_based.greencoin import Greencoin
-from clove.network.bitcoin_based.guncoin import Guncoin
-from clove.network.bitcoin_based.i0coin import I0Coin
-from clove.network.bitcoin_based.ivc_coin import IVCCoin
-from clove.network.bitcoin_based.joulecoin import Joulecoin
-from clove.network.bitcoin_based.komodo import Komodo
-from clove.network.bitcoin_based.lanacoin import LanaCoin, LanaCoinTestNet
-from clove.network.bitcoin_based.litecoin import Litecoin, LitecoinTestNet
-from clove.network.bitcoin_based.machinecoin import Machinecoin, MachinecoinTestNet
-from clove.network.bitcoin_based.monacoin import Monacoin, MonacoinTestNet
-from clove.network.bitcoin_based.monetaryunit import MonetaryUnit, MonetaryUnitTestNet
-from clove.network.bitcoin_based.mooncoin import Mooncoin
-from clove.network.bitcoin_based.myriad import Myriad, MyriadTestNet
-from clove.network.bitcoin_based.navcoin import Navcoin
-from clove.network.bitcoin_based.netko import Netko
-from clove.network.bitcoin_based.nevacoin import NevaCoin, NevaCoinTestNet
-from clove.network.bitcoin_based.particl import Particl, ParticlTestNet
-from clove.network.bitcoin_based.peercoin import Peercoin, PeercoinTestNet
-from clove.network.bitcoin_based.pura import Pura
-from clove.network.bitcoin_based.quark import Quark, QuarkTestNet
-from clove.network.bitcoin_based.ravencoin import Ravencoin, RavencoinTestNet
-from clove.network.bitcoin_based.rubycoin import Rubycoin
-from clove.network.bitcoin_based.sexcoin import Sexcoin, SexcoinTestNet
-from clove.network.bitcoin_based.skeincoin import Skeincoin
-from clove.network.bitcoin_based.solarcoin import SolarCoin, SolarCoinTestNet
-from clove.network.bitcoin_based.swagbucks import SwagBucks
-from clove.network.bitcoin_based.syscoin import Syscoin
-from clove.network.bitcoin_based.tajcoin import TajCoin
-from clove.network.bitcoin_based.tao import Tao, TaoTestNet
-from clove.network.bitcoin_based.vertcoin import Vertcoin, VertcoinTestNet
-from clove.network.bitcoin_based.viacoin import Viacoin, ViacoinTestNet
-from clove.network.bitcoin_based.visio import Visio
-from clove.network.bitcoin_based.vivo import Vivo
-from clove.network.bitcoin_based.zcoin import ZCoin, ZCoinTestNet
-from clove.network.bitcoin_based.zetacoin import Zetacoin, ZetacoinTestNet
-from clove.network.bitcoin_based.zoin import Zoin, ZoinTestNet
-from clove.network.ethereum import Ethereum, EthereumTestnet
-from clove.network.ethereum_based.ellaism import Ellaism, EllaismTestnet
-from clove.network.ethereum_based.ether_gem import EtherGem
-from clove.network.ethereum_based.ethereum_classic import EthereumClassic
-from clove.network.ethereum_based.expanse import Expanse
-from clove.network.ethereum_based.musicoin import Musicoin
+from importlib import import_module
+import sys
+from typing import Iterator
 
-BITCOIN_BASED = (
-    Bitcoin, BitcoinTestNet,
-    AquariusCoin,
-    AudioCoin, AudioCoinTestNet,
-    Bata, BataTestNet,
-    BitcoinCash, BitcoinCashTestNet,
-    BitcoinGold, BitcoinGoldTestNet,
-    Bitcore, BitcoreTestNet,
-    Bitmark,
-    BitSend, BitSendTestNet,
-    BlackCoin,
-    Blocknet,
-    CreativeCoin, CreativeCoinTestNet,
-    Dash, DashTestNet,
-    Digibyte,
-    Dopecoin,
-    EGulden, EGuldenTestNet,
-    Eternity, EternityTestNet,
-    Europecoin,
-    Goldcoin,
-    Greencoin,
-    Guncoin,
-    I0Coin,
-    IVCCoin,
-    Joulecoin,
-    Komodo,
-    LanaCoin, LanaCoinTestNet,
-    Litecoin, LitecoinTestNet,
-    Machinecoin, MachinecoinTestNet,
-    Monacoin, MonacoinTestNet,
-    MonetaryUnit, MonetaryUnitTestNet,
-    Mooncoin,
-    Myriad, MyriadTestNet,
-    Navcoin,
-    Netko,
-    NevaCoin, NevaCoinTestNet,
-    Particl, ParticlTestNet,
-    Peercoin, PeercoinTestNet,
-    Pura,
-    Quark, QuarkTestNet,
-    Ravencoin, RavencoinTestNet,
-    Rubycoin,
-    Sexcoin, SexcoinTestNet,
-    Skeincoin,
-    SolarCoin, SolarCoinTestNet,
-    SwagBucks,
-    Syscoin,
-    TajCoin,
-    Tao, TaoTestNet,
-    Vertcoin, VertcoinTestNet,
-    Viacoin, ViacoinTestNet,
-    Visio,
-    Vivo,
-    ZCoin, ZCoinTestNet,
-    Zetacoin, ZetacoinTestNet,
-    Zoin, ZoinTestNet,
-)
+_BITCOIN_BASED = {
+    'Bitcoin': 'clove.network.bitcoin',
+    'BitcoinTestNet': 'clove.network.bitcoin',
+    'AquariusCoin': 'clove.network.bitcoin_based.aquariuscoin',
+    'AudioCoin': 'clove.network.bitcoin_based.audiocoin',
+    'AudioCoinTestNet': 'clove.network.bitcoin_based.audiocoin',
+    'Bata': 'clove.network.bitcoin_based.bata',
+    'BataTestNet': 'clove.network.bitcoin_based.bata',
+    'BitcoinCash': 'clove.network.bitcoin_based.bitcoin_cash',
+    'BitcoinCashTestNet': 'clove.network.bitcoin_based.bitcoin_cash',
+    'BitcoinGold': 'clove.network.bitcoin_based.bitcoin_gold',
+    'BitcoinGoldTestNet': 'clove.network.bitcoin_based.bitcoin_gold',
+    'Bitcore': 'clove.network.bitcoin_based.bitcore',
+    'BitcoreTestNet': 'clove.network.bitcoin_based.bitcore',
+    'Bitmark': 'clove.network.bitcoin_based.bitmark',
+    'BitSend': 'clove.network.bitcoin_based.bitsend',
+    'BitSendTestNet': 'clove.network.bitcoin_based.bitsend',
+    'BlackCoin': 'clove.network.bitcoin_based.blackcoin',
+    'Blocknet': 'clove.network.bitcoin_based.blocknet',
+    'CreativeCoin': 'clove.network.bitcoin_based.creativecoin',
+    'CreativeCoinTestNet': 'clove.network.bitcoin_based.creativecoin',
+    'Dash': 'clove.network.bitcoin_based.dash',
+    'DashTestNet': 'clove.network.bitcoin_based.dash',
+    'Digibyte': 'clove.network.bitcoin_based.digibyte',
+    'Dopecoin': 'clove.network.bitcoin_based.dopecoin',
+    'EGulden': 'clove.network.bitcoin_based.egulden',
+    'EGuldenTestNet': 'clove.network.bitcoin_based.egulden',
+    'Eternity': 'clove.network.bitcoin_based.eternity',
+    'EternityTestNet': 'clove.network.bitcoin_based.eternity',
+    'Europecoin': 'clove.network.bitcoin_based.europecoin',
+    'Goldcoin': 'clove.network.bitcoin_based.goldcoin',
+    'Greencoin': 'clove.network.bitcoin_based.greencoin',
+    'Guncoin': 'clove.network.bitcoin_based.guncoin',
+    'I0Coin': 'clove.network.bitcoin_based.i0coin',
+    'IVCCoin': 'clove.network.bitcoin_based.ivc_coin',
+    'Joulecoin': 'clove.network.bitcoin_based.joulecoin',
+    'Komodo': 'clove.network.bitcoin_based.komodo',
+    'LanaCoin': 'clove.network.bitcoin_based.lanacoin',
+    'LanaCoinTestNet': 'clove.network.bitcoin_based.lanacoin',
+    'Litecoin': 'clove.network.bitcoin_based.litecoin',
+    'LitecoinTestNet': 'clove.network.bitcoin_based.litecoin',
+    'Machinecoin': 'clove.network.bitcoin_based.machinecoin',
+    'MachinecoinTestNet': 'clove.network.bitcoin_based.machinecoin',
+    'Monacoin': 'clove.network.bitcoin_based.monacoin',
+    'MonacoinTestNet': 'clove.network.bitcoin_based.monacoin',
+    'MonetaryUnit': 'clove.network.bitcoin_based.monetaryunit',
+    'MonetaryUnitTestNet': 'clove.network.bitcoin_based.monetaryunit',
+    'Mooncoin': 'clove.network.bitcoin_based.mooncoin',
+    'Myriad': 'clove.network.bitcoin_based.myriad',
+    'MyriadTestNet': 'clove.network.bitcoin_based.myriad',
+    'Navcoin': 'clove.network.bitcoin_based.navcoin',
+    'Netko': 'clove.network.bitcoin_based.netko',
+    'NevaCoin': 'clove.network.bitcoin_based.nevacoin',
+    'NevaCoinTestNet': 'clove.network.bitcoin_based.nevacoin',
+    'Particl': 'clove.network.bitcoin_based.particl',
+    'ParticlTestNet': 'clove.network.bitcoin_based.particl',
+    'Peercoin': 'clove.network.bitcoin_based.peercoin',
+    'PeercoinTestNet': 'clove.network.bitcoin_based.peercoin',
+    'Pura': 'clove.network.bitcoin_based.pura',
+    'Quark': 'clove.network.bitcoin_based.quark',
+    'QuarkTestNet': 'clove.network.bitcoin_based.quark',
+    'Ravencoin': 'clove.network.bitcoin_based.ravencoin',
+    'RavencoinTestNet': 'clove.network.bitcoin_based.ravencoin',
+    'Rubycoin': 'clove.network.bitcoin_based.rubycoin',
+    'Sexcoin': 'clove.network.bitcoin_based.sexcoin',
+    'SexcoinTestNet': 'clove.network.bitcoin_based.sexcoin',
+    'Skeincoin': 'clove.network.bitcoin_based.skeincoin',
+    'SolarCoin': 'clove.network.bitcoin_based.solarcoin',
+    'SolarCoinTestNet': 'clove.network.bitcoin_based.solarcoin',
+    'SwagBucks': 'clove.network.bitcoin_based.swagbucks',
+    'Syscoin': 'clove.network.bitcoin_based.syscoin',
+    'TajCoin': 'clove.network.bitcoin_based.tajcoin',
+    'Tao': 'clove.network.bitcoin_based.tao',
+    'TaoTestNet': 'clove.network.bitcoin_based.tao',
+    'Vertcoin': 'clove.network.bitcoin_based.vertcoin',
+    'VertcoinTestNet': 'clove.network.bitcoin_based.vertcoin',
+    'Viacoin': 'clove.network.bitcoin_based.viacoin',
+    'ViacoinTestNet': 'clove.network.bitcoin_based.viacoin',
+    'Visio': 'clove.network.bitcoin_based.visio',
+    'Vivo': 'clove.network.bitcoin_based.vivo',
+    'ZCoin': 'clove.network.bitcoin_based.zcoin',
+    'ZCoinTestNet': 'clove.network.bitcoin_based.zcoin',
+    'Zetacoin': 'clove.network.bitcoin_based.zetacoin',
+    'ZetacoinTestNet': 'clove.network.bitcoin_based.zetacoin',
+    'Zoin': 'clove.network.bitcoin_based.zoin',
+    'ZoinTestNet': 'clove.network.bitcoin_based.zoin',
+}
+'''Bitcoin-based network class names and modules in which they are defined.'''
 
-ETHEREUM_BASED = (
-    Ellaism, EllaismTestnet,
-    Ethereum, EthereumTestnet,
-    EthereumClassic,
-    EtherGem,
-    Expanse,
-    Musicoin,
-)
+_ETHEREUM_BASED = {
+    'Ethereum': 'clove.network.ethereum',
+    'EthereumTestnet': 'clove.network.ethereum',
+    'Ellaism': 'clove.network.ethereum_based.ellaism',
+    'EllaismTestnet': 'clove.network.ethereum_based.ellaism',
+    'EtherGem': 'clove.network.ethereum_based.ether_gem',
+    'EthereumClassic': 'clove.network.ethereum_based.ethereum_classic',
+    'Expanse': 'clove.network.ethereum_based.expanse',
+    'Musicoin': 'clove.network.ethereum_based.musicoin',
+}
+'''Ethereum-based network class names and modules in which they are defined.'''
 
+_NETWORK_MODULES = {**_BITCOIN_BASED, **_ETHEREUM_BASED}
+'''Mapping of network class names to modules in which they are defined.'''
 
-__all__ = BITCOIN_BASED + ETHEREUM_BASED
+_NETWORK_SYMBOLS = {
+    'BTC': 'Bitcoin',
+    'XBT': 'Bitcoin',
+    'BTC-TESTNET': 'BitcoinTestNet',
+    'XBT-TESTNET': 'BitcoinTestNet',
+    'ARCO': 'AquariusCoin',
+    'ADC': 'AudioCoin',
+    'ADC-TESTNET': 'AudioCoinTestNet',
+    'BTA': 'Bata',
+    'BTA-TESTNET': 'BataTestNet',
+    'BCH': 'BitcoinCash',
+    'BCH-TESTNET': 'BitcoinCashTestNet',
+    'BTG': 'BitcoinGold',
+    'BTG-TESTNET': 'BitcoinGoldTestNet',
+    'BTX': 'Bitcore',
+    'BTX-TESTNET': 'BitcoreTestNet',
+    'BTM': 'Bitmark',
+    'BSD': 'BitSend',
+    'BSD-TESTNET': 'BitSendTestNet',
+    'BLK': 'BlackCoin',
+    'BLOCK': 'Blocknet',
+    'CREA': 'CreativeCoin',
+    'CREA-TESTNET': 'CreativeCoinTestNet',
+    'DASH': 'Dash',
+    'DASH-TESTNET': 'DashTestNet',
+    'DGB': 'Digibyte',
+    'DOPE': 'Dopecoin',
+    'EFL': 'EGulden',
+    'EFL-TESTNET': 'EGuldenTestNet',
+    'ENT': 'Eternity',
+    'ENT-TESTNET': 'EternityTestNet',
+    'ERC': 'Europecoin',
+    'GLD': 'Goldcoin',
+    'GRE': 'Greencoin',
+    'GUN': 'Guncoin',
+    'I0C': 'I0Coin',
+    'IVC': 'IVCCoin',
+    'XJO': 'Joulecoin',
+    'KMD': 'Komodo',
+    'LANA': 'LanaCoin',
+    'LANA-TESTNET': 'LanaCoinTestNet',
+    'LTC': 'Litecoin',
+    'LTC-TESTNET': 'LitecoinTestNet',
+    'MAC': 'Machinecoin',
+    'MAC-TESTNET': 'MachinecoinTestNet',
+    'MONA': 'Monacoin',
+    'MONA-TESTNET': 'MonacoinTestNet',
+    'MUE': 'MonetaryUnit',
+    'MUE-TESTNET': 'MonetaryUnitTestNet',
+    'MOON': 'Mooncoin',
+    'XMY': 'Myriad',
+    'XMY-TESTNET': 'MyriadTestNet',
+    'NAV': 'Navcoin',
+    'NETKO': 'Netko',
+    'NEVA': 'NevaCoin',
+    'NEVA-TESTNET': 'NevaCoinTestNet',
+    'PART': 'Particl',
+    'PART-TESTNET': 'ParticlTestNet',
+    'PPC': 'Peercoin',
+    'PPC-TESTNET': 'PeercoinTestNet',
+    'PURA': 'Pura',
+    'QRK': 'Quark',
+    'QRK-TESTNET': 'QuarkTestNet',
+    'RVN': 'Ravencoin',
+    'RVN-TESTNET': 'RavencoinTestNet',
+    'RBY': 'Rubycoin',
+    'SXC': 'Sexcoin',
+    'SXC-TESTNET': 'SexcoinTestNet',
+    'SKC': 'Skeincoin',
+    'SLR': 'SolarCoin',
+    'SLR-TESTNET': 'SolarCoinTestNet',
+    'BUCKS': 'SwagBucks',
+    'SYS': 'Syscoin',
+    'TAJ': 'TajCoin',
+    'XTO': 'Tao',
+    'XTO-TESTNET': 'TaoTestNet',
+    'VTC': 'Vertcoin',
+    'VTC-TESTNET': 'VertcoinTestNet',
+    'VIA': 'Viacoin',
+    'VIA-TESTNET': 'ViacoinTestNet',
+    'VISIO': 'Visio',
+    'VIVO': 'Vivo',
+    'XZC': 'ZCoin',
+    'XZC-TESTNET': 'ZCoinTestNet',
+    'ZET': 'Zetacoin',
+    'ZET-TESTNET': 'ZetacoinTestNet',
+    'ZOI': 'Zoin',
+    'ZOI-TESTNET': 'ZoinTestNet',
+    'ETH': 'Ethereum',
+    'ETH-TESTNET': 'EthereumTestnet',
+    'ELLA': 'Ellaism',
+    'ELLA-TESTNET': 'EllaismTestnet',
+    'EGEM': 'EtherGem',
+    'ETC': 'EthereumClassic',
+    'EXP': 'Expanse',
+    'MUSIC': 'Musicoin',
+}
+'''Mapping of network symbols (with `-TESTNET` suffix for test networks) to network class names.'''
+
+
+def __getattr__(name: str):
+    '''
+    Imports network classes on first access (PEP 562).
+
+    Only the module of the requested network is imported, eg. `from clove.network import Bitcoin`
+    does not load Ethereum-based networks. Accessing `BITCOIN_BASED`, `ETHEREUM_BASED` or `__all__`
+    imports all networks from the given group.
+    '''
+    if name == 'BITCOIN_BASED':
+        value = tuple(__getattr__(network) for network in _BITCOIN_BASED)
+    elif name == 'ETHEREUM_BASED':
+        value = tuple(__getattr__(network) for network in _ETHEREUM_BASED)
+    elif name == '__all__':
+        value = __getattr__('BITCOIN_BASED') + __getattr__('ETHEREUM_BASED')
+    elif name in _NETWORK_MODULES:
+        value = getattr(import_module(_NETWORK_MODULES[name]), name)
+    else:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+    globals()[name] = value
+    return value
+
+
+def iter_seed_metadata() -> Iterator[tuple]:
+    '''
+    Yields (network name, seed node address) pairs for all Bitcoin-based networks.
+
+    Example:
+        >>> from clove.network import iter_seed_metadata
+        >>> next(iter_seed_metadata())
+        ('bitcoin', 'seed.bitcoin.sipa.be')
+    '''
+    for network in __getattr__('BITCOIN_BASED'):
+        for seed in network.seeds:
+            yield network.name, seed
+
+
+if sys.version_info < (3, 7):
+    # module level __getattr__ is not supported, so all networks have to be imported eagerly
+    __getattr__('__all__')
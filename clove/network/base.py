@@ -1,3 +1,34 @@
+from importlib import import_module
+from string import Formatter
+import sys
+from typing import Optional
+
+from clove.network import _NETWORK_MODULES, _NETWORK_SYMBOLS
+
+_NETWORKS = {}
+'''Mapping of network symbols (with `-TESTNET` suffix for test networks) to network classes.'''
+
+
+def _split_url_template(template: Optional[str]) -> Optional[tuple]:
+    '''
+    Returns (prefix, suffix) tuple for a format string with a single placeholder, eg. `https://a.io/tx/{0}`.
+    Returns None for templates that cannot be split, eg. without a placeholder or with a repeated one.
+    '''
+    if not template:
+        return
+    parts = ['']
+    for literal_text, field_name, format_spec, conversion in Formatter().parse(template):
+        parts[-1] += literal_text
+        if field_name is not None:
+            if field_name not in ('', '0') or format_spec or conversion:
+                return
+            parts.append('')
+    if len(parts) != 2:
+        return
+    prefix, suffix = parts
+    return prefix, suffix
+
+
 class BaseNetwork(object):
     '''Class for shared properties and methods for Bitcoin and Ethereum network.'''
 
@@ -5,8 +36,8 @@ class BaseNetwork(object):
     '''Network name.'''
     symbols = ()
     '''Tuple with network symbols (some networks may have multiple symbols, eg. Bitcoin).'''
-    networks = {}
-    '''Placeholder for symbol-network mapping.'''
+    default_symbol = None
+    '''Default (first) symbol, set automatically from `symbols` (`None` if `symbols` are not declared).'''
     bitcoin_based = None
     '''Flag for Bitcoin-based networks.'''
     ethereum_based = None
@@ -16,30 +47,75 @@ class BaseNetwork(object):
     blockexplorer_tx = None
     '''Url of the transaction in block explorer (format string)'''
 
-    @property
-    def default_symbol(self) -> str:
-        '''Returns default (first) symbol for networks with multiple symbols.
+    def __init_subclass__(cls, **kwargs):
+        '''
+        Validates network definition, sets the default symbol and registers network under its symbols.
 
-        Returns:
-            str: network symbol
+        Note:
+            Only networks listed in the `clove.network` package are registered, so subclasses defined
+            elsewhere (eg. mocks in tests) cannot replace them.
+        '''
+        super().__init_subclass__(**kwargs)
+        cls.validate_definition()
+        cls.default_symbol = cls.symbols[0] if cls.symbols else None
+        if _NETWORK_MODULES.get(cls.__name__) != cls.__module__:
+            return
+        suffix = '-TESTNET' if cls.testnet else ''
+        _NETWORKS.update((sys.intern(symbol.upper() + suffix), cls) for symbol in cls.symbols)
 
-        Example:
-            >>> from clove.network import Bitcoin
-            >>> bitcoin_network = Bitcoin()
-            >>> bitcoin_network.default_symbol
-            'BTC'
+    @classmethod
+    def validate_definition(cls):
+        '''
+        Checking types of the network class attributes when the class is created.
 
-        Note:
-            This property can return `None` if `symbols` are not declared in the network definition.
+        Raises:
+            AssertionError: if some attribute has a wrong type.
         '''
-        if self.symbols:
-            return self.symbols[0]
+        assert isinstance(cls.symbols, tuple), f'{cls.__name__}.symbols must be a tuple'
+        assert all(isinstance(symbol, str) for symbol in cls.symbols), f'{cls.__name__}.symbols must be strings'
+        if cls.symbols:
+            assert isinstance(cls.name, str), f'{cls.__name__}.name must be a string'
 
     @classmethod
     def is_test_network(cls) -> bool:
         '''Returning True if the network is a testnet.'''
         return cls.testnet
 
+    @classmethod
+    def get_transaction_url_template(cls) -> Optional[str]:
+        '''Returns format string for transaction url in block explorer or `None` if there is no block explorer.'''
+        return cls.blockexplorer_tx
+
+    @classmethod
+    def get_transaction_url(cls, tx_hash: str) -> Optional[str]:
+        '''
+        Returns transaction url for a given transaction hash in block explorer.
+
+        Args:
+            tx_hash (str): transaction hash
+
+        Returns:
+            str, None: Url to transaction, None if there is no block explorer for this network.
+
+        Example:
+            >>> from clove.network import EthereumTestnet
+            >>> network = EthereumTestnet()
+            >>> network.get_transaction_url('0x9e41847c3cc780e4cb59902cf55657f0ee92642d9dee4145e090cbf206d4748f')
+            'https://kovan.etherscan.io/tx/0x9e41847c3cc780e4cb59902cf55657f0ee92642d9dee4145e090cbf206d4748f'
+
+        Note:
+            Url template is split around its placeholder once per network class and cached,
+            so building url is a plain string concatenation. Templates which cannot be split
+            are formatted with `str.format`.
+        '''
+        if '_tx_url_template' not in cls.__dict__:
+            cls._tx_url_template = cls.get_transaction_url_template()
+            cls._tx_url_parts = _split_url_template(cls._tx_url_template)
+        if not cls._tx_url_parts:
+            return cls._tx_url_template.format(tx_hash) if cls._tx_url_template else None
+        prefix, suffix = cls._tx_url_parts
+        return prefix + tx_hash + suffix
+
     @classmethod
     def get_network_by_symbol(cls, symbol: str):
         '''
@@ -56,27 +132,51 @@ class BaseNetwork(object):
 
         Example:
             >>> from clove.network.base import BaseNetwork
-            >>> BaseNetwork.get_network_by_symbol('BTC')
+            >>> BaseNetwork.get_network_by_symbol('btc')
             <clove.network.bitcoin.Bitcoin at 0x7f5a84b233c8>
 
+        Note:
+            Symbol is case-insensitive. Use `get_network_by_canonical_symbol` if symbol is already upper-cased.
         '''
-        if not cls.networks:
-            cls.set_symbol_mapping()
+        return cls.get_network_by_canonical_symbol(sys.intern(symbol.upper()))
+
+    @classmethod
+    def get_network_by_canonical_symbol(cls, symbol: str):
+        '''
+        Returns network instance by its canonical (upper-cased) symbol.
+
+        Args:
+            symbol (str): upper-cased network symbol with `-TESTNET` suffix for test networks
+
+        Returns:
+            Network object
 
-        symbol = symbol.upper()
+        Raises:
+            RuntimeError: if there is no network with given symbol.
 
-        if symbol not in cls.networks:
-            raise RuntimeError(f'{symbol} network is not supported.')
+        Example:
+            >>> from clove.network.base import BaseNetwork
+            >>> BaseNetwork.get_network_by_canonical_symbol('BTC-TESTNET')
+            <clove.network.bitcoin.BitcoinTestNet at 0x7f5a84b233c8>
+        '''
+        if symbol not in _NETWORKS:
+            if symbol not in _NETWORK_SYMBOLS:
+                raise RuntimeError(f'{symbol} network is not supported.')
+            # networks are registered when their modules are imported, so import only the requested one
+            import_module(_NETWORK_MODULES[_NETWORK_SYMBOLS[symbol]])
 
-        return cls.networks[symbol]()
+        return _NETWORKS[symbol]()
 
     @classmethod
-    def set_symbol_mapping(cls):
-        '''Creates symbol-instance mapping.'''
-        from clove.network import __all__ as networks
-        for network in networks:
-            for symbol in network.symbols:
-                if network.is_test_network():
-                    cls.networks[f'{symbol.upper()}-TESTNET'] = network
-                else:
-                    cls.networks[f'{symbol.upper()}'] = network
+    def get_symbol_mapping(cls) -> dict:
+        '''
+        Returns symbol-class mapping for networks of the same kind (mainnet or testnet) as the caller.
+
+        Example:
+            >>> from clove.network import Bitcoin
+            >>> Bitcoin.get_symbol_mapping()['BTC']
+            <class 'clove.network.bitcoin.Bitcoin'>
+        '''
+        # networks are registered when their modules are imported
+        import_module('clove.network').__all__
+        return {symbol: network for symbol, network in _NETWORKS.items() if network.testnet == cls.testnet}
@@ -1,7 +1,9 @@
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from operator import itemgetter
 from random import shuffle
 import socket
 from time import sleep, time
-from typing import Optional
+from typing import Iterator, Optional
 
 import bitcoin
 from bitcoin import SelectParams
@@ -25,8 +27,11 @@ from bitcoin.wallet import CBitcoinAddress, CBitcoinAddressError
 
 from clove.constants import (
     CLOVE_API_URL,
+    FEE_CACHE_FRESH_TTL,
+    FEE_CACHE_STALE_TTL,
     NODE_COMMUNICATION_TIMEOUT,
     REJECT_TIMEOUT,
+    SEED_RESOLVING_TIMEOUT,
     TRANSACTION_BROADCASTING_MAX_ATTEMPTS,
 )
 from clove.exceptions import (
@@ -40,6 +45,7 @@ from clove.network.bitcoin.contract import BitcoinContract
 from clove.network.bitcoin.transaction import BitcoinAtomicSwapTransaction
 from clove.network.bitcoin.wallet import BitcoinWallet
 from clove.utils.bitcoin import auto_switch_params
+from clove.utils.cache import stale_while_revalidate
 from clove.utils.external_source import clove_req_json
 from clove.utils.logging import logger
 from clove.utils.network import generate_params_object
@@ -70,6 +76,15 @@ class BitcoinBaseNetwork(BaseNetwork):
     bitcoin_based = True
     '''Flag for bitcoin-based networks'''
 
+    @classmethod
+    def validate_definition(cls):
+        '''Checking types of the network class attributes, including network connection details.'''
+        super().validate_definition()
+        if cls.symbols:
+            assert isinstance(cls.seeds, tuple), f'{cls.__name__}.seeds must be a tuple'
+            assert isinstance(cls.nodes, tuple), f'{cls.__name__}.nodes must be a tuple'
+            assert isinstance(cls.port, int), f'{cls.__name__}.port must be an integer'
+
     @classmethod
     def switch_params(cls):
         '''
@@ -165,6 +180,39 @@ class BitcoinBaseNetwork(BaseNetwork):
         logger.debug('Got %s nodes', len(nodes))
         return nodes
 
+    @classmethod
+    def get_nodes_from_seeds(cls, seeds: list) -> Iterator[list]:
+        '''
+        Extracting nodes from all seed nodes concurrently.
+
+        Args:
+            seeds (list): list of seed nodes addresses
+
+        Returns:
+            Iterator[list]: lists of IPs of network nodes in the order in which seed nodes were resolved
+
+        Note:
+            All seed nodes are resolved in parallel and lists of nodes are returned as soon as they are ready,
+            so nodes from the fastest seed node can be used without waiting for the others.
+            Seed nodes which are not resolved within `SEED_RESOLVING_TIMEOUT` seconds in total are skipped.
+        '''
+        if not seeds:
+            return
+        deadline = time() + SEED_RESOLVING_TIMEOUT
+        executor = ThreadPoolExecutor(max_workers=len(seeds))
+        try:
+            pending = {executor.submit(cls.get_nodes, seed): seed for seed in seeds}
+            while pending:
+                done, _ = wait(pending, timeout=max(deadline - time(), 0), return_when=FIRST_COMPLETED)
+                if not done:
+                    logger.debug('Timeout while getting nodes from seed nodes %s', ', '.join(pending.values()))
+                    return
+                for future in done:
+                    del pending[future]
+                    yield future.result()
+        finally:
+            executor.shutdown(wait=False)
+
     @auto_switch_params()
     def capture_messages(self, expected_message_types: list, timeout: int=20, buf_size: int=1024,
                          ignore_empty: bool=False) -> list:
@@ -284,20 +332,15 @@ class BitcoinBaseNetwork(BaseNetwork):
             return self.get_current_node()
 
         if self.nodes:
-            # fake seed node to enter the seed nodes loop
-            self.seeds = (None, )
-
-        random_seeds = list(self.seeds)
-        shuffle(random_seeds)
-
-        for seed in random_seeds:
+            # hardcoded nodes
+            nodes_groups = [self.nodes]
+        else:
+            # nodes from seed nodes
+            random_seeds = list(self.seeds)
+            shuffle(random_seeds)
+            nodes_groups = self.get_nodes_from_seeds(random_seeds)
 
-            if seed is None:
-                # get hardcoded nodes
-                nodes = self.nodes
-            else:
-                # get nodes from seed node
-                nodes = self.get_nodes(seed)
+        for nodes in nodes_groups:
 
             nodes = self.filter_blacklisted_nodes(nodes)
 
@@ -333,10 +376,10 @@ class BitcoinBaseNetwork(BaseNetwork):
         Returns:
             list: list of nodes without dead nodes
         '''
-        return sorted(
-            [node for node in nodes if self.blacklist_nodes.get(node, 0) <= max_tries_number],
-            key=lambda node: self.blacklist_nodes.get(node, 0)
-        )
+        get_tries = self.blacklist_nodes.get
+        nodes_with_tries = ((get_tries(node, 0), node) for node in nodes)
+        alive_nodes = [item for item in nodes_with_tries if item[0] <= max_tries_number]
+        return [node for _, node in sorted(alive_nodes, key=itemgetter(0))]
 
     def terminate(self, node: str=None):
         '''
@@ -611,6 +654,7 @@ class BitcoinBaseNetwork(BaseNetwork):
         return cls.get_wallet()
 
     @classmethod
+    @stale_while_revalidate(fresh_ttl=FEE_CACHE_FRESH_TTL, stale_ttl=FEE_CACHE_STALE_TTL)
     def get_current_fee_per_kb(cls) -> Optional[float]:
         """
         Getting current network fee from Clove API
@@ -621,6 +665,10 @@ class BitcoinBaseNetwork(BaseNetwork):
         Example:
             >>> network.get_current_fee_per_kb()
             0.01006814
+
+        Note:
+            Fee is cached for `FEE_CACHE_FRESH_TTL` seconds. After that the cached fee is still returned
+            (and refreshed in the background) for up to `FEE_CACHE_STALE_TTL` seconds.
         """
 
         network = cls.symbols[0].upper()
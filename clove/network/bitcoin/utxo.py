@@ -1,9 +1,15 @@
+from functools import lru_cache
+
 from bitcoin.core import CMutableTxIn, COutPoint, lx, script, x
 
+from clove.utils.bitcoin import from_base_units
+
 
 class Utxo(object):
     '''Unspent transaction output object.'''
 
+    __slots__ = ('tx_id', 'vout', 'value', 'tx_script', 'wallet', 'secret', 'refund', 'contract')
+
     def __init__(self, tx_id: str, vout: str, value: str, tx_script: str, wallet=None, secret: str=None,
                  refund: bool=False, contract: str=None):
 
@@ -47,3 +53,29 @@ class Utxo(object):
             str(self.secret),
             self.refund,
         )
+
+
+@lru_cache(maxsize=4096)
+def _get_utxo_fields(network: str, tx_id: str, vout: int, value: int, tx_script: str) -> tuple:
+    return tx_id, vout, from_base_units(value), tx_script
+
+
+def get_utxo_from_base_units(network: str, tx_id: str, vout: int, value: int, tx_script: str) -> Utxo:
+    '''
+    Returns UTXO object for an unspent output returned by block explorer API.
+
+    Args:
+        network (str): name of the network that the output belongs to
+        tx_id (str): transaction hash
+        vout (int): output number
+        value (int): output value in base units
+        tx_script (str): output script (hex)
+
+    Returns:
+        Utxo: UTXO object
+
+    Note:
+        Converted output fields are cached, but every call returns a new UTXO object, so it can be modified.
+    '''
+    tx_id, vout, value, tx_script = _get_utxo_fields(network, tx_id, vout, value, tx_script)
+    return Utxo(tx_id=tx_id, vout=vout, value=value, tx_script=tx_script)
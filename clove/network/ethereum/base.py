@@ -725,24 +725,3 @@ class EthereumBaseNetwork(BaseNetwork):
                     'secret': events[0]['data'][2:],
                     'transaction_hash': events[0]['transactionHash'].hex()
                 }
-
-    @classmethod
-    def get_transaction_url(cls, tx_hash: str) -> Optional[str]:
-        """
-        Returns transaction url for a given transaction hash in block explorer.
-
-        Args:
-            tx_hash (str): transaction hash
-
-        Returns:
-            str, None: Url to transaction, None if `blockexplorer_tx` was not set for this network.
-
-        Example:
-            >>> from clove.network import EthereumTestnet
-            >>> network = EthereumTestnet()
-            >>> network.get_transaction_url('0x9e41847c3cc780e4cb59902cf55657f0ee92642d9dee4145e090cbf206d4748f')
-            'https://kovan.etherscan.io/tx/0x9e41847c3cc780e4cb59902cf55657f0ee92642d9dee4145e090cbf206d4748f'
-        """
-        if not cls.blockexplorer_tx:
-            return
-        return cls.blockexplorer_tx.format(tx_hash)
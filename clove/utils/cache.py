@@ -0,0 +1,69 @@
+from functools import wraps
+from threading import Lock, Thread
+import time
+
+from clove.utils.logging import logger
+
+
+def stale_while_revalidate(fresh_ttl: int, stale_ttl: int):
+    '''
+    Decorator for caching results of functions that are fetching data from external sources.
+
+    Results younger than `fresh_ttl` seconds are returned straight from the cache. Results younger than
+    `stale_ttl` seconds are returned from the cache too, but a refresh is started in a background thread.
+    Older results are fetched synchronously and never returned. `None` results are treated as failures
+    and are never cached, so a stale value is served while the external source is not responding,
+    but only until it is older than `stale_ttl` seconds.
+
+    Args:
+        fresh_ttl (int): number of seconds for which a cached result is considered fresh
+        stale_ttl (int): number of seconds for which a cached result can still be served
+
+    Example:
+        >>> @classmethod
+        >>> @stale_while_revalidate(fresh_ttl=60, stale_ttl=3600)
+        >>> def get_current_fee_per_kb(cls) -> Optional[float]:
+    '''
+    def wrap(f):
+        cache = {}
+        refreshing = set()
+        lock = Lock()
+
+        def refresh(key, args, kwargs):
+            try:
+                value = f(*args, **kwargs)
+                if value is not None:
+                    cache[key] = (value, time.time())
+            except Exception:
+                logger.debug('Background refresh of %s failed', f.__qualname__, exc_info=True)
+            finally:
+                with lock:
+                    refreshing.discard(key)
+
+        @wraps(f)
+        def wrapped(*args, **kwargs):
+            key = args + tuple(sorted(kwargs.items()))
+            value, fetched_at = cache.get(key, (None, None))
+
+            if fetched_at is not None:
+                age = time.time() - fetched_at
+
+                if age < fresh_ttl:
+                    return value
+
+                if age < stale_ttl:
+                    with lock:
+                        start_refresh = key not in refreshing
+                        refreshing.add(key)
+                    if start_refresh:
+                        Thread(target=refresh, args=(key, args, kwargs), daemon=True).start()
+                    return value
+
+            new_value = f(*args, **kwargs)
+            if new_value is not None:
+                cache[key] = (new_value, time.time())
+            return new_value
+
+        wrapped.cache_clear = cache.clear
+        return wrapped
+    return wrap
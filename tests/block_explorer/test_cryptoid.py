@@ -1,6 +1,6 @@
 from unittest.mock import patch
 
-from clove.network import Litecoin
+from clove.network import Digibyte, Litecoin
 
 
 @patch('clove.block_explorer.cryptoid.clove_req_json')
@@ -173,3 +173,8 @@ def test_get_balance(request_mock, fake_cryptoid_token):
 def test_get_transaction_url():
     url = Litecoin().get_transaction_url('123')
     assert url == 'https://chainz.cryptoid.info/ltc/tx.dws?123.htm'
+
+
+def test_transaction_url_template_is_cached_per_network():
+    assert Litecoin.get_transaction_url('123') == 'https://chainz.cryptoid.info/ltc/tx.dws?123.htm'
+    assert Digibyte.get_transaction_url('123') == 'https://chainz.cryptoid.info/dgb/tx.dws?123.htm'
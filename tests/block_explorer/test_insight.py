@@ -148,6 +148,13 @@ def test_get_utxo(request_mock):
     utxo = Ravencoin.get_utxo(address='RM7w75BcC21LzxRe62jy8JhFYykRedqu8k', amount=11)
     assert len(utxo) == 2
 
+    utxo[0].wallet = 'wallet'
+    refreshed_utxo = Ravencoin.get_utxo(address='RM7w75BcC21LzxRe62jy8JhFYykRedqu8k', amount=11)
+    assert refreshed_utxo[0] is not utxo[0]
+    assert refreshed_utxo[0].wallet is None
+    assert [(u.tx_id, u.vout, u.value, u.tx_script) for u in refreshed_utxo] == \
+        [(u.tx_id, u.vout, u.value, u.tx_script) for u in utxo]
+
 
 @patch('clove.block_explorer.insight.clove_req_json')
 def test_get_balance(request_mock):
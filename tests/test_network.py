@@ -1,4 +1,6 @@
 import ipaddress
+import socket
+from threading import Event
 from unittest.mock import patch
 
 import bitcoin
@@ -8,7 +10,8 @@ from validators import domain
 
 from clove.exceptions import ImpossibleDeserialization
 from clove.network import BITCOIN_BASED as networks
-from clove.network import BitcoinTestNet, ZCoin
+from clove.network import Bitcoin, BitcoinTestNet, ZCoin, iter_seed_metadata
+from clove.network import _NETWORK_SYMBOLS
 from clove.network.bitcoin.base import BitcoinBaseNetwork
 from clove.utils.bitcoin import auto_switch_params
 from clove.utils.search import get_network_by_symbol
@@ -17,20 +20,12 @@ from clove.utils.search import get_network_by_symbol
 @mark.parametrize('network', networks)
 def test_bitcoin_based_network_definitions(network):
     assert isinstance(network.API, bool)
-    assert isinstance(network.name, str)
-    assert isinstance(network.symbols, tuple)
     assert isinstance(network().default_symbol, str)
     assert getattr(network, 'seeds') or getattr(network, 'nodes'), f'[{network.__name__}] no seeds and nodes'
     if network.nodes:
-        assert isinstance(network.nodes, tuple)
         assert not network.seeds, f'{network}: use nodes or seeds, not both.'
         for node in network.nodes:
             assert ipaddress.ip_address(node)
-    else:
-        assert isinstance(network.seeds, tuple)
-        for seed in network.seeds:
-            assert domain(seed)
-    assert isinstance(network.port, int)
     assert isinstance(network.blacklist_nodes, dict)
     assert isinstance(network.message_start, bytes)
     assert isinstance(network.base58_prefixes, dict)
@@ -41,6 +36,11 @@ def test_bitcoin_based_network_definitions(network):
         assert isinstance(network.blockexplorer_tx, str)
 
 
+@mark.parametrize('network_name,seed', list(iter_seed_metadata()))
+def test_seeds_valid_dns_address(network_name, seed):
+    assert domain(seed), f'[{network_name}] {seed} is not a valid domain'
+
+
 def test_network_source_code_url_is_unique():
     mainnet_networks = [network for network in networks if not network.is_test_network()]
     source_code_urls_of_networks = set([network.source_code_url for network in mainnet_networks])
@@ -88,6 +88,46 @@ def test_get_network_obj_on_not_existing_network():
     assert get_network_by_symbol('NON_EXISTING_NETWORK_SYMBOL') is None
 
 
+def test_get_network_by_canonical_symbol():
+    assert type(BitcoinBaseNetwork.get_network_by_canonical_symbol('BTC-TESTNET')) == BitcoinTestNet
+    with raises(RuntimeError):
+        BitcoinBaseNetwork.get_network_by_canonical_symbol('btc')
+
+
+def test_subclass_does_not_replace_registered_network():
+    class MockBitcoin(Bitcoin):
+        pass
+
+    assert type(BitcoinBaseNetwork.get_network_by_symbol('BTC')) is Bitcoin
+    assert MockBitcoin not in BitcoinBaseNetwork.get_symbol_mapping().values()
+
+
+def test_symbol_mapping_is_separated_by_network_type():
+    assert BitcoinTestNet.get_symbol_mapping()['BTC-TESTNET'] is BitcoinTestNet
+    assert 'BTC' not in BitcoinTestNet.get_symbol_mapping()
+    assert BitcoinBaseNetwork.get_symbol_mapping()['BTC'] is Bitcoin
+    assert 'BTC-TESTNET' not in BitcoinBaseNetwork.get_symbol_mapping()
+
+
+def test_network_symbols_table_matches_registered_networks():
+    mainnet_mapping = BitcoinBaseNetwork.get_symbol_mapping()
+    testnet_mapping = BitcoinTestNet.get_symbol_mapping()
+    registered_networks = {**mainnet_mapping, **testnet_mapping}
+    assert {symbol: network.__name__ for symbol, network in registered_networks.items()} == _NETWORK_SYMBOLS
+
+
+@mark.parametrize('attributes,error_message', [
+    ({'symbols': ('BRK')}, 'symbols must be a tuple'),
+    ({'symbols': (b'BRK',)}, 'symbols must be strings'),
+    ({'symbols': ('BRK',)}, 'name must be a string'),
+    ({'symbols': ('BRK',), 'name': 'broken', 'seeds': ['seed.broken.io']}, 'seeds must be a tuple'),
+    ({'symbols': ('BRK',), 'name': 'broken', 'port': '8333'}, 'port must be an integer'),
+])
+def test_network_definition_validation(attributes, error_message):
+    with raises(AssertionError, match=error_message):
+        type('BrokenNetwork', (BitcoinBaseNetwork,), attributes)
+
+
 @mark.parametrize('network_symbol,address,is_valid', [
     ('LTC', 'LUAn5PWmsPavgz32mGkqsUuAKncftS37Jq', True),
     ('BTC', '13iNsKgMfVJQaYVFqp5ojuudxKkVCMtkoa', True),
@@ -145,3 +185,49 @@ def test_blockexplorer_tx_url():
     url = btc_network.get_transaction_url('123')
     assert url.startswith('http')
     assert '123' in url
+
+
+@mark.parametrize('blockexplorer_tx,url', [
+    ('https://explorer.example.com/tx/{0}/details', 'https://explorer.example.com/tx/123/details'),
+    ('https://explorer.example.com/tx/{}', 'https://explorer.example.com/tx/123'),
+    ('https://explorer.example.com/tx/{0}#{0}', 'https://explorer.example.com/tx/123#123'),
+    ('https://explorer.example.com/tx/{0:>5}', 'https://explorer.example.com/tx/  123'),
+    ('https://explorer.example.com/{{tx}}/{0}', 'https://explorer.example.com/{tx}/123'),
+    ('https://explorer.example.com/tx', 'https://explorer.example.com/tx'),
+    (None, None),
+])
+def test_blockexplorer_tx_url_templates(blockexplorer_tx, url):
+    network = type('ExplorerNetwork', (BitcoinBaseNetwork,), {'blockexplorer_tx': blockexplorer_tx})
+    assert network.get_transaction_url('123') == url
+    assert network.get_transaction_url('123') == url
+
+
+@patch('socket.gethostbyname_ex')
+def test_get_nodes_from_seeds(gethostbyname_mock):
+    gethostbyname_mock.side_effect = lambda seed: (seed, [], [f'{seed}-node'])
+    nodes = BitcoinBaseNetwork.get_nodes_from_seeds(['seed-1', 'seed-2', 'seed-3'])
+    assert sorted(nodes) == [['seed-1-node'], ['seed-2-node'], ['seed-3-node']]
+
+
+@patch('clove.network.bitcoin.base.SEED_RESOLVING_TIMEOUT', 0.1)
+@patch('socket.gethostbyname_ex')
+def test_get_nodes_from_seeds_skips_slow_seeds(gethostbyname_mock):
+    slow_seed_released = Event()
+
+    def resolve(seed):
+        if seed == 'slow-seed':
+            slow_seed_released.wait()
+        return seed, [], [f'{seed}-node']
+
+    gethostbyname_mock.side_effect = resolve
+    try:
+        nodes = BitcoinBaseNetwork.get_nodes_from_seeds(['slow-seed', 'fast-seed'])
+        assert list(nodes) == [['fast-seed-node']]
+    finally:
+        slow_seed_released.set()
+
+
+@patch('socket.gethostbyname_ex', side_effect=socket.gaierror)
+def test_get_nodes_from_not_resolvable_seeds(gethostbyname_mock):
+    assert list(BitcoinBaseNetwork.get_nodes_from_seeds(['seed-1', 'seed-2'])) == [[], []]
+    assert list(BitcoinBaseNetwork.get_nodes_from_seeds([])) == []
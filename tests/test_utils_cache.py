@@ -0,0 +1,78 @@
+from unittest.mock import MagicMock, patch
+
+from clove.utils.cache import stale_while_revalidate
+
+
+class FakeThread:
+
+    def __init__(self, target, args, daemon):
+        self.target = target
+        self.args = args
+
+    def start(self):
+        self.target(*self.args)
+
+
+def cached_fetch_mock():
+    fetch_mock = MagicMock(__qualname__='fetch_mock')
+    return fetch_mock, stale_while_revalidate(fresh_ttl=60, stale_ttl=3600)(fetch_mock)
+
+
+@patch('clove.utils.cache.time.time')
+def test_fresh_value_is_returned_from_cache(time_mock):
+    fetch_mock, cached_fetch = cached_fetch_mock()
+    fetch_mock.return_value = 0.001
+    time_mock.return_value = 1000
+
+    assert cached_fetch('BTC') == 0.001
+    time_mock.return_value = 1059
+    assert cached_fetch('BTC') == 0.001
+    assert fetch_mock.call_count == 1
+
+    assert cached_fetch('LTC') == 0.001
+    assert fetch_mock.call_count == 2
+
+
+@patch('clove.utils.cache.Thread', FakeThread)
+@patch('clove.utils.cache.time.time')
+def test_stale_value_is_returned_and_refreshed(time_mock):
+    fetch_mock, cached_fetch = cached_fetch_mock()
+    fetch_mock.return_value = 0.001
+    time_mock.return_value = 1000
+    cached_fetch('BTC')
+
+    fetch_mock.return_value = 0.002
+    time_mock.return_value = 1100
+    assert cached_fetch('BTC') == 0.001
+    assert cached_fetch('BTC') == 0.002
+    assert fetch_mock.call_count == 2
+
+
+@patch('clove.utils.cache.Thread', FakeThread)
+@patch('clove.utils.cache.time.time')
+def test_stale_value_is_returned_on_failure(time_mock):
+    fetch_mock, cached_fetch = cached_fetch_mock()
+    fetch_mock.return_value = 0.001
+    time_mock.return_value = 1000
+    cached_fetch('BTC')
+
+    fetch_mock.return_value = None
+    time_mock.return_value = 4000
+    assert cached_fetch('BTC') == 0.001
+    assert fetch_mock.call_count == 2
+
+    cached_fetch.cache_clear()
+    assert cached_fetch('BTC') is None
+
+
+@patch('clove.utils.cache.time.time')
+def test_expired_value_is_not_returned_on_failure(time_mock):
+    fetch_mock, cached_fetch = cached_fetch_mock()
+    fetch_mock.return_value = 0.001
+    time_mock.return_value = 1000
+    cached_fetch('BTC')
+
+    fetch_mock.return_value = None
+    time_mock.return_value = 5000
+    assert cached_fetch('BTC') is None
+    assert fetch_mock.call_count == 2